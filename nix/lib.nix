@@ -137,6 +137,7 @@ rec {
         compose
         tahoe-capabilities
         sqlparse
+        orjson
         autobahn
         # It would be nice if we got challenge-bypass-ristretto as
         # something we could `callPackage` but instead we just get a
@@ -13,26 +13,78 @@
 # limitations under the License.
 
 from json import dumps as _dumps
-from json import loads as _loads
-from typing import Any, cast
+from json import loads as _stdlib_loads
+from math import isfinite
+from re import compile as _compile
+from typing import Any, Union, cast
+
+from orjson import JSONDecodeError, JSONEncodeError
+from orjson import dumps as _orjson_dumps
+from orjson import loads as _loads
 
 from ._types import JSON
 
+# orjson parses integers outside of [-2 ** 63, 2 ** 64 - 1] as floats,
+# silently losing precision.  Every such positive integer has at least 20
+# digits and every such negative integer has a "-" followed by at least 19
+# digits.  Any document without a run like that is safe to give to orjson.
+# Others are given to the stdlib decoder instead.
+_long_number = _compile(rb"-[0-9]{19}|[0-9]{20}")
+_long_number_text = _compile(r"-[0-9]{19}|[0-9]{20}")
+
+
+def _has_non_finite_float(o: Any) -> bool:
+    """
+    Determine whether a float NaN or infinity appears anywhere in a structure
+    of JSON-compatible values.
+    """
+    if isinstance(o, float):
+        return not isfinite(o)
+    if isinstance(o, dict):
+        return any(_has_non_finite_float(v) for v in o.values())
+    if isinstance(o, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in o)
+    return False
+
 
 def dumps_utf8(o: Any) -> bytes:
     """
     Serialize an object to a UTF-8-encoded JSON byte string.
     """
-    return _dumps(o).encode("utf-8")
+    try:
+        result = _orjson_dumps(o)
+    except JSONEncodeError:
+        # orjson refuses some values the stdlib encoder accepts (for example,
+        # integers outside of the 64 bit range or strings containing lone
+        # surrogates).  Fall back to the slower encoder for those so callers
+        # see no change in behavior.
+        return _dumps(o).encode("utf-8")
+    # orjson writes NaN and the infinities as null where the stdlib encoder
+    # writes NaN and Infinity.  They can only be present if null is.
+    if b"null" in result and _has_non_finite_float(o):
+        return _dumps(o).encode("utf-8")
+    return result
 
 
-def loads(data: bytes) -> JSON:
+def loads(data: Union[bytes, str]) -> JSON:
     """
     Load a JSON object from a byte string.
 
     Raise an exception including ``data`` if the parse fails.
     """
     try:
-        return cast(JSON, _loads(data))
+        if isinstance(data, str):
+            has_long_number = _long_number_text.search(data) is not None
+        else:
+            has_long_number = _long_number.search(data) is not None
+        if not has_long_number:
+            try:
+                return cast(JSON, _loads(data))
+            except JSONDecodeError:
+                # orjson rejects some documents the stdlib decoder accepts
+                # (NaN, Infinity, and escaped lone surrogates, all of which
+                # dumps_utf8 can write).  Let the stdlib decoder try those.
+                pass
+        return cast(JSON, _stdlib_loads(data))
     except ValueError as e:
         raise ValueError("{!r}: {!r}".format(e, data))
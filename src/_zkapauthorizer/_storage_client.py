@@ -35,7 +35,7 @@ from typing_extensions import Concatenate, ParamSpec
 from zope.interface import implementer
 
 from .eliot import CALL_WITH_PASSES, SIGNATURE_CHECK_FAILED, log_call_coroutine
-from .foolscap import ShareStat
+from .foolscap import ShareStat, unpack_share_stats
 from .spending import IPassGroup
 from .storage_common import (
     ClientTestWriteVector,
@@ -283,6 +283,27 @@ async def stat_shares(
     return known
 
 
+async def stat_shares_packed(
+    rref: IRemoteReference, storage_indexes: list[bytes]
+) -> list[dict[int, ShareStat]]:
+    unknown = await rref.callRemote(  # type: ignore[no-untyped-call]
+        "stat_shares_packed",
+        storage_indexes,
+    )
+    if not isinstance(unknown, list):
+        raise ValueError(
+            f"expected stat_shares_packed to return list, got {type(unknown)}"
+        )
+    known: list[dict[int, ShareStat]] = []
+    for packed in unknown:
+        if not isinstance(packed, bytes):
+            raise ValueError(
+                f"expected stat_shares_packed to return list of bytes, instead got element of {type(packed)}"
+            )
+        known.append(unpack_share_stats(packed))
+    return known
+
+
 async def get_share_sizes(
     rref: IRemoteReference, storage_index: bytes
 ) -> dict[int, int]:
@@ -561,6 +582,16 @@ class ZKAPAuthorizerStorageClient(object):
     ) -> list[dict[int, ShareStat]]:
         return await stat_shares(rref, storage_indexes)
 
+    @with_rref
+    async def stat_shares_packed(
+        self, rref: IRemoteReference, storage_indexes: list[bytes]
+    ) -> list[dict[int, ShareStat]]:
+        """
+        Like ``stat_shares`` but use the compact ``stat_shares_packed`` remote
+        method.  Only servers which implement that method support this.
+        """
+        return await stat_shares_packed(rref, storage_indexes)
+
     @with_rref
     @log_call_coroutine("zkapauthorizer:storage-client:advise-corrupt-share")
     async def advise_corrupt_share(
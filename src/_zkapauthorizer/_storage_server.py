@@ -78,7 +78,7 @@ from twisted.python.reflect import namedAny
 from zope.interface import implementer
 
 from .eliot import log_call
-from .foolscap import RIPrivacyPassAuthorizedStorageServer, ShareStat
+from .foolscap import RIPrivacyPassAuthorizedStorageServer, ShareStat, pack_share_stats
 from .model import Pass
 from .server.spending import ISpender
 from .storage_common import (
@@ -498,6 +498,16 @@ class ZKAPAuthorizerStorageServer(Referenceable):
             for storage_index_or_slot in storage_indexes_or_slots
         )
 
+    def remote_stat_shares_packed(
+        self, storage_indexes_or_slots: list[bytes]
+    ) -> list[bytes]:
+        return [
+            pack_share_stats(
+                get_share_stats(self._original, storage_index_or_slot, None)
+            )
+            for storage_index_or_slot in storage_indexes_or_slots
+        ]
+
     def remote_slot_testv_and_readv_and_writev(
         self,
         passes: list[bytes],
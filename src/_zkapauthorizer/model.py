@@ -389,12 +389,28 @@ class VoucherStore(ConnectionHaver):
         else:
             raise NotEmpty("there is existing local state")
 
-    @with_cursor
-    def get(self, cursor: _ReplicationCapableCursor, /, voucher: bytes) -> Voucher:
+    def get(self, voucher: bytes) -> Voucher:
         """
         :param voucher: The text value of a voucher to retrieve.
 
         :return: The voucher object that matches the given value.
+
+        :raise KeyError: If the store has no voucher matching the given value.
+        """
+        voucher_obj = self.find(voucher)
+        if voucher_obj is None:
+            raise KeyError(voucher)
+        return voucher_obj
+
+    @with_cursor
+    def find(
+        self, cursor: _ReplicationCapableCursor, /, voucher: bytes
+    ) -> Optional[Voucher]:
+        """
+        :param voucher: The text value of a voucher to look for.
+
+        :return: The voucher object that matches the given value or ``None``
+            if the store has no such voucher.
         """
         cursor.execute(
             """
@@ -407,10 +423,10 @@ class VoucherStore(ConnectionHaver):
             """,
             (voucher.decode("ascii"),),
         )
-        refs = cursor.fetchall()
-        if len(refs) == 0:
-            raise KeyError(voucher)
-        return Voucher.from_row(refs[0])
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return Voucher.from_row(row)
 
     @with_cursor
     def add(
@@ -515,7 +531,7 @@ class VoucherStore(ConnectionHaver):
         )
         refs = cursor.fetchall()
 
-        return list(Voucher.from_row(row) for row in refs)
+        return [Voucher.from_row(row) for row in refs]
 
     @with_cursor
     def insert_unblinded_tokens_for_voucher(
@@ -22,8 +22,8 @@ In the future it should also allow users to read statistics about token usage.
 """
 
 from collections.abc import Awaitable
-from functools import partial
-from json import dumps
+from functools import lru_cache, partial
+from re import compile as _compile
 from typing import Callable, Optional, Union, cast
 
 from attr import Factory, define, field
@@ -48,7 +48,6 @@ from zope.interface import Attribute
 
 from . import NAME
 from . import __version__ as _zkapauthorizer_version
-from ._base64 import urlsafe_b64decode
 from ._json import dumps_utf8, loads
 from ._types import JSON
 from .config import Config
@@ -69,6 +68,20 @@ from .storage_common import (
 # The number of tokens to submit with a voucher redemption.
 NUM_TOKENS = 2**15
 
+# The largest request body, in bytes, accepted by ``PUT /voucher``.  A
+# well-formed request is well under 100 bytes so this leaves plenty of room
+# for whitespace while bounding the memory a misbehaving client can make us
+# use.
+MAX_VOUCHER_BODY = 256
+
+# A voucher is 32 bytes, urlsafe-base64 encoded.  That is 44 characters from
+# the urlsafe-base64 alphabet, the last two of which may be padding.  These
+# are the strings of that length which ``_base64.urlsafe_b64decode`` accepts,
+# but checking it does not require decoding the voucher.
+_VOUCHER_PATTERN = "[A-Za-z0-9-_]{42}(?:[A-Za-z0-9-_]{2}|[A-Za-z0-9-_]=|==)"
+_voucher_validator = _compile(_VOUCHER_PATTERN)
+_voucher_bytes_validator = _compile(_VOUCHER_PATTERN.encode("ascii"))
+
 
 class IZKAPRoot(IResource):
     """
@@ -348,7 +361,7 @@ class RecoverFactory(WebSocketServerFactory):  # type: ignore[misc]
         """
         Whenever the state of recovery changes, update all our clients
         """
-        update_msg = dumps(state.marshal()).encode("utf8")
+        update_msg = dumps_utf8(state.marshal())
         self.sent_updates.append(update_msg)
         for client in self.clients:
             client.sendMessage(update_msg, False)
@@ -665,6 +678,8 @@ class _VoucherCollection(Resource):
     retrieved to monitor the status of previously submitted vouchers.
     """
 
+    __slots__ = ("_store", "_controller")
+
     _log = Logger()
 
     def __init__(self, store: VoucherStore, controller: PaymentController):
@@ -676,13 +691,16 @@ class _VoucherCollection(Resource):
         """
         Record a voucher and begin attempting to redeem it.
         """
+        body = request.content.read(MAX_VOUCHER_BODY + 1)
+        if len(body) > MAX_VOUCHER_BODY:
+            return bad_request("request body too large").render(request)  # type: ignore[no-untyped-call,no-any-return]
         try:
-            payload = loads(request.content.read())
+            payload = loads(body)
         except Exception:
             return bad_request("json request body required").render(request)  # type: ignore[no-untyped-call,no-any-return]
         if not isinstance(payload, dict):
             return bad_request("request body must be a JSON object").render(request)  # type: ignore[no-untyped-call,no-any-return]
-        if payload.keys() != {"voucher"}:
+        if len(payload) != 1 or "voucher" not in payload:
             return bad_request(  # type: ignore[no-any-return]
                 "request object must have exactly one key: 'voucher'"
             ).render(
@@ -704,20 +722,20 @@ class _VoucherCollection(Resource):
         application_json(request)
         return dumps_utf8(
             {
-                "vouchers": list(
+                "vouchers": [
                     self._controller.incorporate_transient_state(voucher).marshal()
                     for voucher in self._store.list()
-                ),
+                ],
             }
         )
 
     def getChild(self, segment: bytes, request: IRequest) -> IResource:
-        voucher_str = segment.decode("utf-8")
-        if not is_syntactic_voucher(voucher_str):
+        # Path segments are bytes and the store wants bytes so there is no
+        # need to decode the segment at all.
+        if not is_syntactic_voucher_bytes(segment):
             return bad_request()
-        try:
-            voucher_obj = self._store.get(voucher_str.encode("ascii"))
-        except KeyError:
+        voucher_obj = self._store.find(segment)
+        if voucher_obj is None:
             return NoResource()  # type: ignore[no-untyped-call]
         return VoucherView(self._controller.incorporate_transient_state(voucher_obj))
 
@@ -731,17 +749,18 @@ def is_syntactic_voucher(voucher: str) -> bool:
         the validity of the represented voucher itself.  A ``True`` result
         only means the string can be **interpreted** as a voucher.
     """
-    if not isinstance(voucher, str):
-        return False
-    if len(voucher) != 44:
-        # TODO.  44 is the length of 32 bytes base64 encoded.  This model
-        # information presumably belongs somewhere else.
+    if not isinstance(voucher, str) or len(voucher) != 44:
         return False
-    try:
-        urlsafe_b64decode(voucher.encode("ascii"))
-    except Exception:
+    return _voucher_validator.fullmatch(voucher) is not None
+
+
+def is_syntactic_voucher_bytes(voucher: bytes) -> bool:
+    """
+    Like ``is_syntactic_voucher`` but for an ASCII-encoded byte string.
+    """
+    if not isinstance(voucher, bytes) or len(voucher) != 44:
         return False
-    return True
+    return _voucher_bytes_validator.fullmatch(voucher) is not None
 
 
 class VoucherView(Resource):
@@ -749,6 +768,9 @@ class VoucherView(Resource):
     This class implements a view for a ``Voucher`` instance.
     """
 
+    # One of these is created for every request for a voucher's state.
+    __slots__ = ("_voucher",)
+
     def __init__(self, voucher: Voucher) -> None:
         """
         :param Voucher reference: The model object for which to provide a
@@ -762,6 +784,10 @@ class VoucherView(Resource):
         return self._voucher.to_json()
 
 
+# ``ErrorPage`` keeps no per-request state so one instance per reason can be
+# shared by every request.  All callers pass a literal reason so the cache
+# stays small.
+@lru_cache(maxsize=None)
 def bad_request(reason: str = "Bad Request") -> IResource:
     """
     :return: A resource which can be rendered to produce a **BAD REQUEST**
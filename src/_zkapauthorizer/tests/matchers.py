@@ -28,7 +28,6 @@ __all__ = [
 ]
 
 from datetime import datetime, timedelta
-from json import loads
 from typing import (
     Callable,
     Container,
@@ -66,6 +65,7 @@ from treq.response import IResponse
 from twisted.web.http_headers import Headers
 from zope.interface.interface import InterfaceClass
 
+from .._json import loads
 from ..foolscap import ShareStat
 from ..model import Pass
 from ..server.spending import _SpendingData
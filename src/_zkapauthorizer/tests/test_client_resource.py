@@ -17,9 +17,14 @@ Tests for the web resource provided by the client part of the Tahoe-LAFS
 plugin.
 """
 
+from base64 import urlsafe_b64encode
+from binascii import Error as BinasciiError
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
+from string import ascii_letters, digits
 from typing import (
+    Any,
     Awaitable,
     BinaryIO,
     Callable,
@@ -33,7 +38,7 @@ from urllib.parse import quote
 
 from allmydata.client import config_from_string
 from aniso8601 import parse_datetime
-from attrs import Factory, frozen
+from attrs import field, frozen
 from autobahn.twisted.testing import (
     MemoryReactorClockResolver,
     create_memory_agent,
@@ -41,11 +46,12 @@ from autobahn.twisted.testing import (
 )
 from fixtures import TempDir
 from hyperlink import DecodedURL
-from hypothesis import given, note
+from hypothesis import Phase, example, given, note, settings
 from hypothesis.strategies import (
     SearchStrategy,
     binary,
     builds,
+    characters,
     dictionaries,
     fixed_dictionaries,
     integers,
@@ -61,15 +67,18 @@ from openapi_spec_validator import validate_spec
 from openapi_spec_validator.readers import read_from_filename
 from tahoe_capabilities import (
     Capability,
+    CHKRead,
     DirectoryReadCapability,
     DirectoryWriteCapability,
     MDMFDirectoryWrite,
+    MDMFWrite,
     SSKDirectoryRead,
     SSKDirectoryWrite,
     SSKRead,
+    SSKWrite,
     danger_real_capability_string,
 )
-from tahoe_capabilities.strategies import chk_reads, mdmf_writes, ssk_writes
+from tahoe_capabilities.strategies import mdmf_writes, ssk_writes
 from testtools import TestCase
 from testtools.content import text_content
 from testtools.matchers import (
@@ -98,11 +107,11 @@ from testtools.twistedsupport import (
 from treq.response import IResponse
 from treq.testing import RequestTraversalAgent
 from twisted.internet.address import IPv4Address
-from twisted.internet.base import DelayedCall
-from twisted.internet.defer import Deferred
-from twisted.internet.task import Clock, Cooperator
+from twisted.internet.defer import Deferred, gatherResults, succeed
+from twisted.internet.interfaces import IConsumer
+from twisted.internet.task import Clock
 from twisted.python.filepath import FilePath
-from twisted.web.client import FileBodyProducer, readBody
+from twisted.web.client import readBody
 from twisted.web.http import (
     BAD_REQUEST,
     CONFLICT,
@@ -114,7 +123,12 @@ from twisted.web.http import (
     UNAUTHORIZED,
 )
 from twisted.web.http_headers import Headers
-from twisted.web.iweb import IAgent
+from twisted.web.iweb import IAgent, IBodyProducer
+from twisted.web.resource import IResource
+from twisted.web.server import Request as ServerRequest
+from twisted.web.server import Site
+from twisted.web.test.requesthelper import DummyChannel
+from zope.interface import implementer
 
 from .. import NAME
 from .. import __file__ as package_init_file
@@ -152,12 +166,15 @@ from ..replicate import (
     with_replication,
 )
 from ..resource import (
+    MAX_VOUCHER_BODY,
     NUM_TOKENS,
     IZKAPRoot,
     RecoverFactory,
     RecoverProtocol,
     from_configuration,
     get_token_count,
+    is_syntactic_voucher,
+    is_syntactic_voucher_bytes,
     recover,
 )
 from ..storage_common import (
@@ -198,26 +215,31 @@ def directory_writes() -> SearchStrategy[DirectoryWriteCapability]:
 
 TRANSIENT_ERROR = "something went wrong, who knows what"
 
-# Helper to work-around https://github.com/twisted/treq/issues/161
-def uncooperator(started: bool = True) -> Cooperator:
-    def schedule(f: Callable[[], object]) -> DelayedCall:
-        f()
-        return DelayedCall(
-            time=0,
-            func=f,
-            args=(),
-            kw={},
-            cancel=lambda dc: None,
-            reset=lambda dc: None,
-            seconds=lambda: 0,
-        )
-
-    return Cooperator(
-        # Don't stop consuming the iterator until it's done.
-        terminationPredicateFactory=lambda: lambda: False,
-        scheduler=schedule,
-        started=started,
-    )
+# A body producer which writes its whole body synchronously.  This
+# works around https://github.com/twisted/treq/issues/161 and, since the
+# bodies in these tests are all small, avoids driving a ``Cooperator`` for
+# every request as ``FileBodyProducer`` would.
+@implementer(IBodyProducer)
+@frozen
+class _BytesProducer(object):
+    body: bytes
+
+    @property
+    def length(self) -> int:
+        return len(self.body)
+
+    def startProducing(self, consumer: IConsumer) -> Deferred[None]:
+        consumer.write(self.body)
+        return succeed(None)
+
+    def pauseProducing(self) -> None:
+        pass
+
+    def resumeProducing(self) -> None:
+        pass
+
+    def stopProducing(self) -> None:
+        pass
 
 
 def is_not_json(bytestring: bytes) -> bool:
@@ -233,16 +255,30 @@ def is_not_json(bytestring: bytes) -> bool:
     return False
 
 
+# The characters which may appear in an urlsafe-base64 encoded string.
+_URLSAFE_BASE64_DATA_CHARACTERS = ascii_letters + digits + "-_"
+URLSAFE_BASE64_CHARACTERS = _URLSAFE_BASE64_DATA_CHARACTERS + "="
+
+# The length of an urlsafe-base64 encoded voucher, including padding.
+VOUCHER_LENGTH = 44
+
+
 def not_vouchers() -> SearchStrategy[bytes]:
     """
     Builds byte strings which are not legal vouchers.
     """
     return one_of(
-        text()
-        .filter(
-            lambda t: (not is_urlsafe_base64(t)),
-        )
-        .map(lambda t: t.encode("utf-8")),
+        # Any text with at least one character from outside of the
+        # urlsafe-base64 alphabet.  Build these directly instead of filtering
+        # arbitrary text so Hypothesis doesn't have to reject any.
+        tuples(
+            text(),
+            characters(
+                blacklist_categories=("Cs",),
+                blacklist_characters=URLSAFE_BASE64_CHARACTERS,
+            ),
+            text(),
+        ).map(lambda parts: "".join(parts).encode("utf-8")),
         vouchers().map(
             # Turn a valid voucher into a voucher that is invalid only by
             # containing a character from the base64 alphabet in place of one
@@ -250,20 +286,35 @@ def not_vouchers() -> SearchStrategy[bytes]:
             lambda voucher: b"/"
             + voucher[1:],
         ),
+        # Urlsafe-base64 text of any length other than a voucher's.
+        one_of(
+            text(alphabet=URLSAFE_BASE64_CHARACTERS, max_size=VOUCHER_LENGTH - 1),
+            text(alphabet=URLSAFE_BASE64_CHARACTERS, min_size=VOUCHER_LENGTH + 1),
+        ).map(lambda voucher: voucher.encode("ascii")),
+        # A valid voucher with its trailing padding moved somewhere other
+        # than the end.
+        tuples(vouchers(), integers(min_value=0, max_value=VOUCHER_LENGTH - 2),).map(
+            lambda parts: parts[0][: parts[1]]
+            + b"="
+            + parts[0][parts[1] : VOUCHER_LENGTH - 1],
+        ),
+        # Voucher-length urlsafe-base64 text with more padding than any
+        # encoding ever produces.
+        text(
+            alphabet=_URLSAFE_BASE64_DATA_CHARACTERS,
+            min_size=VOUCHER_LENGTH - 3,
+            max_size=VOUCHER_LENGTH - 3,
+        ).map(lambda voucher: voucher.encode("ascii") + b"==="),
     )
 
 
-def is_urlsafe_base64(text: str) -> bool:
+def voucher_body(voucher: bytes) -> bytes:
     """
-    :param text: A candidate text string to inspect.
-
-    :return bool: ``True`` if and only if ``text`` is urlsafe-base64 encoded
+    :return: A valid ``PUT /voucher`` request body for the given voucher.
+        Vouchers are urlsafe-base64 so they need no escaping to be a JSON
+        string and the body can be formatted directly.
     """
-    try:
-        urlsafe_b64decode(text.encode("utf-8"))
-    except:
-        return False
-    return True
+    return b'{"voucher": "%s"}' % (voucher,)
 
 
 def invalid_bodies() -> SearchStrategy[bytes]:
@@ -271,21 +322,13 @@ def invalid_bodies() -> SearchStrategy[bytes]:
     Build byte strings that ``PUT /voucher`` considers invalid.
     """
     return one_of(
-        # The wrong key but the right kind of value.
-        fixed_dictionaries(
-            {
-                "some-key": vouchers().map(lambda v: v.decode("utf-8")),
-            }
-        ).map(dumps_utf8),
+        # The wrong key but the right kind of value.  See ``voucher_body``.
+        vouchers().map(lambda v: b'{"some-key": "%s"}' % (v,)),
         # The right key but the wrong kind of value.
-        fixed_dictionaries(
-            {
-                "voucher": one_of(
-                    integers(),
-                    not_vouchers().map(lambda v: v.decode("utf-8")),
-                ),
-            }
-        ).map(dumps_utf8),
+        integers().map(lambda n: b'{"voucher": %d}' % (n,)),
+        not_vouchers().map(
+            lambda v: b'{"voucher": %s}' % (dumps_utf8(v.decode("utf-8")),)
+        ),
         # Not even JSON
         binary().filter(is_not_json),
     )
@@ -305,6 +348,7 @@ def root_from_config(
     setup_replication: Callable[
         [], Awaitable[DirectoryReadCapability]
     ] = fail_setup_replication,
+    store: Optional[VoucherStore] = None,
 ) -> IZKAPRoot:
     """
     Create a client root resource from a Tahoe-LAFS configuration.
@@ -314,16 +358,21 @@ def root_from_config(
     :param now: A no-argument callable that returns the time of the call as a
         ``datetime`` instance.
 
+    :param store: If not ``None``, a store to give to the resource instead of
+        opening a new one (and creating its schema) for the configuration.
+
     :return IResource: The root client resource.
     """
-    db_path = FilePath(config.get_private_path(CONFIG_DB_NAME)).asTextMode()
-    return from_configuration(
-        config,
-        open_store(
+    if store is None:
+        db_path = FilePath(config.get_private_path(CONFIG_DB_NAME)).asTextMode()
+        store = open_store(
             now,
             with_replication(memory_connect(db_path.path), False),
             config,
-        ),
+        )
+    return from_configuration(
+        config,
+        store,
         get_downloader=get_downloader,
         setup_replication=setup_replication,
         clock=Clock(),
@@ -356,10 +405,11 @@ def authorized_request(
 
     :return: A ``Deferred`` like the one returned by ``IAgent.request``.
     """
+    bodyProducer: Optional[IBodyProducer]
     if data is None:
         bodyProducer = None
     else:
-        bodyProducer = FileBodyProducer(data, cooperator=uncooperator())
+        bodyProducer = _BytesProducer(data.read())
     if headers is None:
         header_obj = Headers()
     else:
@@ -374,6 +424,63 @@ def authorized_request(
     )
 
 
+@frozen
+class RenderedResponse(object):
+    """
+    The response to a request rendered by ``render_sync``.
+
+    This has the ``code``, ``phrase``, and ``headers`` of ``IResponse`` so the
+    response matchers below apply to it as well.
+    """
+
+    code: int
+    phrase: bytes
+    headers: Headers
+    body: bytes
+
+
+def render_sync(
+    api_auth_token: bytes,
+    root: IResource,
+    method: bytes,
+    path: bytes,
+    headers: Optional[dict[bytes, list[bytes]]] = None,
+    body: bytes = b"",
+) -> RenderedResponse:
+    """
+    Render a request with the required token-based authorization header value
+    directly against a resource, without an agent or a connection.
+
+    This is only suitable for requests which the resource finishes
+    synchronously.
+
+    :param path: The path (and query) of the request, without a scheme or
+        host.
+
+    See ``authorized_request`` for the other parameters.
+    """
+    header_obj = Headers(headers)
+    header_obj.setRawHeaders(b"authorization", [b"tahoe-lafs " + api_auth_token])
+
+    channel = DummyChannel()
+    channel.site = Site(root)
+    request = ServerRequest(channel)
+    request.requestHeaders = header_obj
+    request.gotLength(len(body))
+    request.handleContentChunk(body)
+    # HTTP/1.0 so the response body is not chunked.
+    request.requestReceived(method, path, b"HTTP/1.0")
+    assert request.finished, f"{method!r} {path!r} did not finish synchronously"
+
+    _, response_body = channel.transport.written.getvalue().split(b"\r\n\r\n", 1)
+    return RenderedResponse(
+        code=request.code,
+        phrase=request.code_message,
+        headers=request.responseHeaders,
+        body=response_body,
+    )
+
+
 def get_config_with_api_token(
     tempdir: TempDir, get_config: GetConfig, api_auth_token: bytes
 ) -> Config:
@@ -403,14 +510,92 @@ def add_api_token_to_config(
     basedir: str, config: Config, api_auth_token: bytes
 ) -> None:
     """
-    Create a private directory beneath the given base directory, point the
-    given config at it, and write the given API auth token to it.
+    Create a private directory beneath the given base directory (if it does
+    not already exist), point the given config at it, and write the given API
+    auth token to it.
     """
-    FilePath(basedir).child("private").makedirs()
+    FilePath(basedir).child("private").makedirs(ignoreExistingDirectory=True)
     config._basedir = basedir
     config.write_private_config("api_auth_token", api_auth_token)
 
 
+# A dummy Ristretto key for configurations that need one.  See
+# ``dummy_ristretto_keys``.
+_FIXED_KEY = "A" * 43 + "="
+
+# The text of a complete Tahoe-LAFS configuration with the client plugin
+# enabled, for tests which do not care about the configuration details.
+FIXED_CONFIG_TEXT = config_string_from_sections(
+    [
+        {
+            "client": {"storage.plugins": NAME},
+            "storageclient.plugins."
+            + NAME: {
+                "redeemer": "dummy",
+                "issuer-public-key": _FIXED_KEY,
+                "allowed-public-keys": _FIXED_KEY,
+            },
+        },
+    ]
+)
+
+
+def get_fixed_config(basedir: str) -> Config:
+    """
+    Get a ``_Config`` object for ``FIXED_CONFIG_TEXT``.
+
+    :param basedir: The path of the node directory the configuration will
+        use.
+    """
+    return config_from_string(basedir, "tub.port", FIXED_CONFIG_TEXT.encode("utf-8"))
+
+
+@frozen
+class FixedRoot(object):
+    """
+    A client root resource, and an agent for it, built from
+    ``FIXED_CONFIG_TEXT``.
+
+    The API auth token is read from the node directory for each request so one
+    of these can serve many Hypothesis examples, each with its own token.
+    """
+
+    basedir: str
+    config: Config
+    root: IZKAPRoot
+    agent: IAgent
+
+    @classmethod
+    def create(cls, basedir: str, store: Optional[VoucherStore] = None) -> "FixedRoot":
+        """
+        Build a root resource and agent for a node at the given directory.
+
+        :param store: See ``root_from_config``.
+        """
+        config = get_fixed_config(basedir)
+        root = root_from_config(config, aware_now, store=store)
+        return cls(basedir, config, root, RequestTraversalAgent(root))
+
+    def set_api_auth_token(self, api_auth_token: bytes) -> None:
+        """
+        Make the given token the one the root resource requires.
+        """
+        add_api_token_to_config(self.basedir, self.config, api_auth_token)
+
+
+# A few examples are enough for the properties of some tests (routing, for
+# example).  Cap them at five but respect profiles that ask for even fewer.
+few_examples = settings(max_examples=min(settings.default.max_examples, 5))
+
+# Some tests drive whole PUT and GET flows through the resource for every
+# example.  Cap them at 25 examples and do not shrink failures, since every
+# shrink step repeats the whole flow.
+io_heavy = settings(
+    max_examples=min(settings.default.max_examples, 25),
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+
+
 T = TypeVar("T")
 
 
@@ -441,14 +626,22 @@ class FromConfigurationTests(TestCase):
     Tests for ``from_configuration``.
     """
 
+    def setUp(self) -> None:
+        super(FromConfigurationTests, self).setUp()
+        # Tests in this class and several others below leave no state behind
+        # in the node directory.  At most the API auth token differs between
+        # examples and it is rewritten each time.  So one directory can serve
+        # every Hypothesis example of a test instead of a new one each time.
+        self.tempdir = self.useFixture(TempDir())
+
+    @few_examples
     @given(tahoe_configs())
     def test_allowed_public_keys(self, get_config: GetConfig) -> None:
         """
         The controller created by ``from_configuration`` is configured to allow
         the public keys found in the configuration.
         """
-        tempdir = self.useFixture(TempDir())
-        config = get_config(tempdir.join("tahoe"), "tub.port")
+        config = get_config(self.tempdir.join("tahoe"), "tub.port")
         allowed_public_keys = get_configured_allowed_public_keys(config)
 
         # root_from_config is just an easier way to call from_configuration
@@ -466,6 +659,12 @@ class GetTokenCountTests(TestCase):
     Tests for ``get_token_count``.
     """
 
+    def setUp(self) -> None:
+        super(GetTokenCountTests, self).setUp()
+        # Shared by all Hypothesis examples.  See FromConfigurationTests.setUp.
+        self.tempdir = self.useFixture(TempDir())
+
+    @few_examples
     @given(one_of(none(), integers(min_value=16)))
     def test_get_token_count(self, token_count: Optional[int]) -> None:
         """
@@ -488,7 +687,7 @@ class GetTokenCountTests(TestCase):
             ]
         )
         node_config = config_from_string(
-            self.useFixture(TempDir()).join("tahoe"),
+            self.tempdir.join("tahoe"),
             "tub.port",
             config_text.encode("utf-8"),
         )
@@ -503,20 +702,27 @@ class ResourceTests(TestCase):
     General tests for the resources exposed by the plugin.
     """
 
-    @given(
-        tahoe_configs(),
-        request_paths(),
-    )
-    def test_unauthorized(self, get_config: GetConfig, path: list[bytes]) -> None:
+    def setUp(self) -> None:
+        super(ResourceTests, self).setUp()
+        # Shared by all Hypothesis examples.  See FromConfigurationTests.setUp.
+        self.tempdir = self.useFixture(TempDir())
+        # These tests exercise routing and never write to the store so they
+        # can also share one instead of creating a database schema per
+        # example.
+        self.store = self.useFixture(TemporaryVoucherStore(aware_now)).store
+        # Tests where the plugin configuration is not under test share one
+        # root resource (and an agent for it) built from a fixed
+        # configuration.
+        self.fixed = FixedRoot.create(self.tempdir.join("tahoe"), self.store)
+
+    @few_examples
+    @given(request_paths())
+    def test_unauthorized(self, path: list[bytes]) -> None:
         """
         A request for any resource without the required authorization token
         receives a 401 response.
         """
-        tempdir = self.useFixture(TempDir())
-        config = get_config(tempdir.join("tahoe"), "tub.port")
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
-        requesting = agent.request(
+        requesting = self.fixed.agent.request(
             b"GET",
             b"http://127.0.0.1/" + b"/".join(path),
         )
@@ -533,41 +739,14 @@ class ResourceTests(TestCase):
             Equals(UNAUTHORIZED),
         )
 
-    @given(
-        tahoe_configs(),
-        sampled_from(
-            [
-                [b"voucher"],
-                [b"version"],
-                [b"recover"],
-                [b"replicate"],
-                [b"lease-maintenance"],
-                [b"calculate-price"],
-            ]
-        ),
-        api_auth_tokens(),
-    )
-    def test_reachable(
-        self, get_config: GetConfig, request_path: list[bytes], api_auth_token: bytes
-    ) -> None:
+    @few_examples
+    @given(api_auth_tokens())
+    def test_reachable(self, api_auth_token: bytes) -> None:
         """
         A resource is reachable at a child of the resource returned by
         ``from_configuration``.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
-        requesting = authorized_request(
-            api_auth_token,
-            agent,
-            b"GET",
-            b"http://127.0.0.1/" + b"/".join(request_path),
-        )
-
+        self.fixed.set_api_auth_token(api_auth_token)
         matches_status = matches_response(
             code_matcher=Not(
                 MatchesAny(
@@ -576,30 +755,39 @@ class ResourceTests(TestCase):
                 )
             ),
         )
-        self.assertThat(
-            requesting,
-            succeeded(matches_status),
-        )
+        # There are only a handful of children so check every one of them
+        # rather than having Hypothesis pick among them.
+        for request_path in [
+            b"voucher",
+            b"version",
+            b"recover",
+            b"replicate",
+            b"lease-maintenance",
+            b"calculate-price",
+        ]:
+            requesting = authorized_request(
+                api_auth_token,
+                self.fixed.agent,
+                b"GET",
+                b"http://127.0.0.1/" + request_path,
+            )
+            self.assertThat(
+                requesting,
+                succeeded(matches_status),
+                request_path.decode("ascii"),
+            )
 
-    @given(
-        tahoe_configs(),
-        api_auth_tokens(),
-    )
-    def test_version(self, get_config: GetConfig, api_auth_token: bytes) -> None:
+    @few_examples
+    @given(api_auth_tokens())
+    def test_version(self, api_auth_token: bytes) -> None:
         """
         The ZKAPAuthorizer package version is available in a JSON response to a
         **GET** to ``/version``.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
+        self.fixed.set_api_auth_token(api_auth_token)
         requesting = authorized_request(
             api_auth_token,
-            agent,
+            self.fixed.agent,
             b"GET",
             b"http://127.0.0.1/version",
         )
@@ -625,14 +813,21 @@ class ReplicateTests(TestCase):
     Tests for the ``/replicate`` endpoint.
     """
 
+    def setUp(self) -> None:
+        super(ReplicateTests, self).setUp()
+        # Shared by all Hypothesis examples.  See FromConfigurationTests.setUp.
+        self.tempdir = self.useFixture(TempDir())
+        # Likewise the store and the configuration.  See ResourceTests.setUp.
+        self.store = self.useFixture(TemporaryVoucherStore(aware_now)).store
+        self.basedir = self.tempdir.join("tahoe")
+        self.config = get_fixed_config(self.basedir)
+
     @given(
-        tahoe_configs(),
         api_auth_tokens(),
         directory_writes().map(lambda rw: rw.reader),
     )
     def test_already_configured(
         self,
-        get_config: GetConfig,
         api_auth_token: bytes,
         dir_ro: DirectoryReadCapability,
     ) -> None:
@@ -640,16 +835,17 @@ class ReplicateTests(TestCase):
         If replication has already been configured then the endpoint returns a
         response with a 409 status code.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
+        add_api_token_to_config(self.basedir, self.config, api_auth_token)
 
         async def setup_replication() -> NoReturn:
             raise ReplicationAlreadySetup(danger_real_capability_string(dir_ro))
 
-        root = root_from_config(config, aware_now, setup_replication=setup_replication)
+        root = root_from_config(
+            self.config,
+            aware_now,
+            setup_replication=setup_replication,
+            store=self.store,
+        )
         agent = RequestTraversalAgent(root)
         configuring = authorized_request(
             api_auth_token,
@@ -667,26 +863,24 @@ class ReplicateTests(TestCase):
         )
 
     @given(
-        tahoe_configs(),
         api_auth_tokens(),
     )
-    def test_internal_server_error(
-        self, get_config: GetConfig, api_auth_token: bytes
-    ) -> None:
+    def test_internal_server_error(self, api_auth_token: bytes) -> None:
         """
         If there is an unexpected exception setting up replication then the
         endpoint returns a response with a 500 status code.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
+        add_api_token_to_config(self.basedir, self.config, api_auth_token)
 
         async def setup_replication() -> NoReturn:
             raise SurpriseBug("surprise")
 
-        root = root_from_config(config, aware_now, setup_replication=setup_replication)
+        root = root_from_config(
+            self.config,
+            aware_now,
+            setup_replication=setup_replication,
+            store=self.store,
+        )
         agent = RequestTraversalAgent(root)
         configuring = authorized_request(
             api_auth_token,
@@ -715,13 +909,11 @@ class ReplicateTests(TestCase):
         )
 
     @given(
-        tahoe_configs(),
         api_auth_tokens(),
         directory_writes().map(lambda rw: rw.reader),
     )
     def test_created(
         self,
-        get_config: GetConfig,
         api_auth_token: bytes,
         cap_ro: DirectoryReadCapability,
     ) -> None:
@@ -730,16 +922,17 @@ class ReplicateTests(TestCase):
         a 201 status code and an application/json-encoded body containing a
         read-only directory capability.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
+        add_api_token_to_config(self.basedir, self.config, api_auth_token)
 
         async def setup_replication() -> DirectoryReadCapability:
             return cap_ro
 
-        root = root_from_config(config, aware_now, setup_replication=setup_replication)
+        root = root_from_config(
+            self.config,
+            aware_now,
+            setup_replication=setup_replication,
+            store=self.store,
+        )
         agent = RequestTraversalAgent(root)
         configuring = authorized_request(
             api_auth_token,
@@ -775,6 +968,10 @@ class RecoverTests(TestCase):
     GOOD_CAPABILITY = SSKDirectoryRead(SSKRead.derive(b"x" * 16, b"y" * 32))
     GOOD_CAPABILITY_STR = danger_real_capability_string(GOOD_CAPABILITY)
 
+    # The address of the client connecting to the memory agent's server
+    # protocols.
+    ADDRESS = IPv4Address("TCP", "127.0.0.1", 0)
+
     # All of the test methods complete synchronously but the Autobahn testing
     # "pumper" stops asynchronously and we need to wait for it or delayed
     # calls leak into the global reactor and fail later tests.
@@ -792,13 +989,22 @@ class RecoverTests(TestCase):
         timeout=90.0, suppress_twisted_logging=True
     )
 
+    def setUp(self) -> None:
+        super(RecoverTests, self).setUp()
+        # One reactor and pumper serve every Hypothesis example of a test.
+        # Connections from earlier examples are dropped by the pumper once
+        # both sides have disconnected.
+        self.clock = MemoryReactorClockResolver()
+        self.pumper = create_pumper()
+        self.addCleanup(self.pumper.stop)
+        self.pumper.start()
+        # Examples get their own empty store, copied from this one.
+        self.empty_store = self.useFixture(TemporaryVoucherStore(aware_now))
+
     @given(
-        tahoe_configs(),
         api_auth_tokens(),
     )
-    def test_internal_server_error(
-        self, get_config: GetConfig, api_auth_token: bytes
-    ) -> None:
+    def test_internal_server_error(self, api_auth_token: bytes) -> None:
         """
         If recovery fails for some unrecognized reason we receive an error
         update over the WebSocket.
@@ -810,19 +1016,14 @@ class RecoverTests(TestCase):
         def broken_get_downloader(cap: object) -> NoReturn:
             raise DownloaderBroken("Downloader is broken")
 
-        clock = MemoryReactorClockResolver()
-        store = self.useFixture(TemporaryVoucherStore(aware_now, get_config)).store
-        pumper = create_pumper()
-        self.addCleanup(pumper.stop)
+        store = self.empty_store.copy_store()
+
+        factory = RecoverFactory(store, broken_get_downloader)
 
         def create_proto() -> RecoverProtocol:
-            factory = RecoverFactory(store, broken_get_downloader)
-            addr = IPv4Address("TCP", "127.0.0.1", 0)
-            proto = factory.buildProtocol(addr)
-            return proto
+            return factory.buildProtocol(self.ADDRESS)
 
-        agent = create_memory_agent(clock, pumper, create_proto)
-        pumper.start()
+        agent = create_memory_agent(self.clock, self.pumper, create_proto)
 
         recovering = Deferred.fromCoroutine(
             recover(
@@ -832,7 +1033,7 @@ class RecoverTests(TestCase):
                 self.GOOD_CAPABILITY,
             )
         )
-        pumper._flush()
+        self.pumper._flush()
 
         self.assertThat(
             recovering,
@@ -853,13 +1054,12 @@ class RecoverTests(TestCase):
         )
 
     @given(
-        tahoe_configs(),
         api_auth_tokens(),
-        existing_states(min_vouchers=1),
+        # Any state at all conflicts so a single voucher is enough.
+        existing_states(min_vouchers=1, max_vouchers=1),
     )
     def test_conflict(
         self,
-        get_config: GetConfig,
         api_auth_token: bytes,
         existing_state: ExistingState,
     ) -> None:
@@ -878,21 +1078,16 @@ class RecoverTests(TestCase):
             # double spent voucher
             # invalid unblinded tokens
 
-        clock = MemoryReactorClockResolver()
-        store = self.useFixture(TemporaryVoucherStore(aware_now, get_config)).store
+        store = self.empty_store.copy_store()
         # put some existing state in the store
         create(store, existing_state)
-        pumper = create_pumper()
-        self.addCleanup(pumper.stop)
+
+        factory = RecoverFactory(store, get_fail_downloader)
 
         def create_proto() -> RecoverProtocol:
-            factory = RecoverFactory(store, get_fail_downloader)
-            addr = IPv4Address("TCP", "127.0.0.1", 0)
-            proto = factory.buildProtocol(addr)
-            return proto
+            return factory.buildProtocol(self.ADDRESS)
 
-        agent = create_memory_agent(clock, pumper, create_proto)
-        pumper.start()
+        agent = create_memory_agent(self.clock, self.pumper, create_proto)
 
         recovering = Deferred.fromCoroutine(
             recover(
@@ -902,7 +1097,7 @@ class RecoverTests(TestCase):
                 self.GOOD_CAPABILITY,
             )
         )
-        pumper._flush()
+        self.pumper._flush()
 
         self.assertThat(
             recovering,
@@ -959,19 +1154,26 @@ class RecoverTests(TestCase):
             dumps_utf8({"recovery-capability": "hello world"}),
         )
 
-    @given(one_of([directory_writes(), chk_reads()]))
-    def test_not_a_readonly_dircap(self, cap: Capability) -> None:
+    def test_not_a_readonly_dircap(self) -> None:
         """
         If the ``recovery-capability`` property value is not a read-only directory
         capability string then the endpoint returns a 400 response.
         """
-        self._request_error_test(
-            dumps_utf8(
-                {
-                    "recovery-capability": danger_real_capability_string(cap),
-                }
-            ),
-        )
+        # Only the kind of capability matters here, not its secrets, so
+        # check one of each kind instead of generating them.
+        caps: list[Capability] = [
+            SSKDirectoryWrite(SSKWrite.derive(b"x" * 16, b"y" * 32)),
+            MDMFDirectoryWrite(MDMFWrite.derive(b"x" * 16, b"y" * 32)),
+            CHKRead.derive(b"x" * 16, b"y" * 32, 3, 10, 1024),
+        ]
+        for cap in caps:
+            self._request_error_test(
+                dumps_utf8(
+                    {
+                        "recovery-capability": danger_real_capability_string(cap),
+                    }
+                ),
+            )
 
     def _request_error_test(self, message: bytes) -> list[tuple[bytes, bool]]:
         """
@@ -1004,10 +1206,9 @@ class RecoverTests(TestCase):
         return messages
 
     @given(
-        tahoe_configs(),
         api_auth_tokens(),
     )
-    def test_status(self, get_config: GetConfig, api_auth_token: bytes) -> None:
+    def test_status(self, api_auth_token: bytes) -> None:
         """
         A first websocket that initiates a recovery sees the same messages
         as a second client (that uses the same dircap).
@@ -1028,19 +1229,13 @@ class RecoverTests(TestCase):
 
             return do_download
 
-        clock = MemoryReactorClockResolver()
-        store = self.useFixture(TemporaryVoucherStore(aware_now, get_config)).store
+        store = self.empty_store.copy_store()
         factory = RecoverFactory(store, get_success_downloader)
-        pumper = create_pumper()
-        self.addCleanup(pumper.stop)
 
         def create_proto() -> RecoverProtocol:
-            addr = IPv4Address("TCP", "127.0.0.1", 0)
-            proto = factory.buildProtocol(addr)
-            return proto
+            return factory.buildProtocol(self.ADDRESS)
 
-        agent = create_memory_agent(clock, pumper, create_proto)
-        pumper.start()
+        agent = create_memory_agent(self.clock, self.pumper, create_proto)
 
         # do two recoveries; they should both get the same status messages
         recovering = [
@@ -1054,11 +1249,11 @@ class RecoverTests(TestCase):
             )
             for i in range(2)
         ]
-        pumper._flush()
+        self.pumper._flush()
 
         # now let the download succeed
         downloading_d.callback(None)
-        pumper._flush()
+        self.pumper._flush()
 
         expected_messages = [
             {
@@ -1212,6 +1407,120 @@ def matches_iso8601_datetime() -> Matcher[str]:
     )
 
 
+# Strategies used by many of the tests below, built just once.
+tahoe_configs_with_dummy_redeemer = tahoe_configs()
+any_api_auth_tokens = api_auth_tokens()
+any_vouchers = vouchers()
+
+
+def _reference_is_syntactic_voucher(voucher: str) -> bool:
+    """
+    Decide whether ``voucher`` is syntactically a voucher the slow way, by
+    decoding it.  This is how ``is_syntactic_voucher`` used to work.
+
+    :return: ``True`` if and only if ``voucher`` is 44 characters long and
+        ``urlsafe_b64decode`` accepts its ASCII encoding.
+    """
+    if len(voucher) != VOUCHER_LENGTH:
+        return False
+    try:
+        urlsafe_b64decode(voucher.encode("ascii"))
+    except (UnicodeEncodeError, BinasciiError):
+        return False
+    return True
+
+
+def voucher_candidates() -> SearchStrategy[str]:
+    """
+    Build text strings which may or may not be vouchers, mostly ones close
+    enough to vouchers to be interesting.
+    """
+    return one_of(
+        text(),
+        text(
+            alphabet=URLSAFE_BASE64_CHARACTERS + "+/",
+            min_size=VOUCHER_LENGTH - 1,
+            max_size=VOUCHER_LENGTH + 1,
+        ),
+        # Encodings with no, one, and two padding characters.
+        binary(min_size=31, max_size=33).map(
+            lambda data: urlsafe_b64encode(data).decode("ascii"),
+        ),
+    )
+
+
+class SyntacticVoucherTests(TestCase):
+    """
+    Tests for ``is_syntactic_voucher`` and ``is_syntactic_voucher_bytes``.
+    """
+
+    @given(voucher_candidates())
+    @example("A" * 44)
+    @example("A" * 43 + "=")
+    @example("A" * 42 + "==")
+    @example("A" * 41 + "===")
+    @example("A" * 40 + "====")
+    @example("A" * 20 + "=" + "A" * 23)
+    @example("AA==" + "A" * 40)
+    @example("/" + "A" * 43)
+    @example("+" + "A" * 43)
+    @example("\N{LATIN SMALL LETTER E WITH ACUTE}" + "A" * 43)
+    def test_text(self, candidate: str) -> None:
+        """
+        ``is_syntactic_voucher`` accepts exactly the text strings which
+        ``_reference_is_syntactic_voucher`` accepts.
+        """
+        self.assertThat(
+            is_syntactic_voucher(candidate),
+            Equals(_reference_is_syntactic_voucher(candidate)),
+        )
+
+    @given(one_of(none(), integers(), binary(), lists(text())))
+    def test_not_text(self, candidate: Any) -> None:
+        """
+        ``is_syntactic_voucher`` rejects anything which is not a text string.
+        """
+        self.assertThat(is_syntactic_voucher(candidate), Equals(False))
+
+    @given(
+        one_of(
+            voucher_candidates().map(lambda candidate: candidate.encode("utf-8")),
+            binary(),
+        ),
+    )
+    @example(b"A" * 43 + b"=")
+    @example(b"A" * 42 + b"==")
+    @example(b"A" * 41 + b"===")
+    @example(b"A" * 20 + b"=" + b"A" * 23)
+    @example(b"A" * 40 + b"====")
+    # The old validator's ``$`` also matches just before a final newline.
+    @example(b"A" * 43 + b"\n")
+    @example(b"A" * 42 + b"=\n")
+    @example(b"\xff" + b"A" * 43)
+    def test_bytes(self, candidate: bytes) -> None:
+        """
+        ``is_syntactic_voucher_bytes`` accepts exactly the byte strings which
+        are the ASCII encoding of text ``_reference_is_syntactic_voucher``
+        accepts.
+        """
+        try:
+            expected = _reference_is_syntactic_voucher(candidate.decode("ascii"))
+        except UnicodeDecodeError:
+            expected = False
+        self.assertThat(
+            is_syntactic_voucher_bytes(candidate),
+            Equals(expected),
+        )
+
+    @given(one_of(none(), integers(), text(), lists(binary())))
+    def test_not_bytes(self, candidate: Any) -> None:
+        """
+        ``is_syntactic_voucher_bytes`` rejects anything which is not a byte
+        string.
+        """
+        self.assertThat(is_syntactic_voucher_bytes(candidate), Equals(False))
+
+
 class VoucherTests(TestCase):
     """
     Tests relating to ``/voucher`` as implemented by the
@@ -1222,8 +1531,20 @@ class VoucherTests(TestCase):
     def setUp(self) -> None:
         super(VoucherTests, self).setUp()
         self.useFixture(CaptureTwistedLogs())
+        self._fixed: Optional[FixedRoot] = None
 
-    @given(tahoe_configs(), api_auth_tokens(), vouchers())
+    @property
+    def fixed(self) -> FixedRoot:
+        """
+        A root resource shared by all the examples of a test which never stores
+        a voucher.  See ResourceTests.setUp.  Most tests in this class do store
+        vouchers so it is only built for the tests which use it.
+        """
+        if self._fixed is None:
+            self._fixed = FixedRoot.create(self.useFixture(TempDir()).join("tahoe"))
+        return self._fixed
+
+    @given(tahoe_configs_with_dummy_redeemer, any_api_auth_tokens, any_vouchers)
     def test_put_voucher(
         self, get_config: GetConfig, api_auth_token: bytes, voucher: bytes
     ) -> None:
@@ -1239,7 +1560,7 @@ class VoucherTests(TestCase):
         )
         root = root_from_config(config, aware_now)
         agent = RequestTraversalAgent(root)
-        data = BytesIO(dumps_utf8({"voucher": voucher.decode("ascii")}))
+        data = BytesIO(voucher_body(voucher))
         requesting = authorized_request(
             api_auth_token,
             agent,
@@ -1258,108 +1579,129 @@ class VoucherTests(TestCase):
             ),
         )
 
-    @given(tahoe_configs(), api_auth_tokens(), invalid_bodies())
-    def test_put_invalid_body(
-        self, get_config: GetConfig, api_auth_token: bytes, body: bytes
-    ) -> None:
+    @given(any_api_auth_tokens, invalid_bodies())
+    def test_put_invalid_body(self, api_auth_token: bytes, body: bytes) -> None:
         """
         If the body of a ``PUT`` to ``VoucherCollection`` does not consist of an
         object with a single *voucher* property then the response is *BAD
         REQUEST*.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
-        requesting = authorized_request(
+        self.fixed.set_api_auth_token(api_auth_token)
+        response = render_sync(
             api_auth_token,
-            agent,
+            self.fixed.root,
             b"PUT",
-            b"http://127.0.0.1/voucher",
-            data=BytesIO(body),
+            b"/voucher",
+            body=body,
         )
         self.addDetail(
-            "requesting result",
-            text_content(f"{vars(requesting.result)}"),
+            "response",
+            text_content(f"{response}"),
         )
         self.assertThat(
-            requesting,
-            succeeded(
-                bad_request_response(),
+            response,
+            bad_request_response(),
+        )
+
+    @given(any_api_auth_tokens, any_vouchers)
+    def test_put_too_large_body(self, api_auth_token: bytes, voucher: bytes) -> None:
+        """
+        If the body of a ``PUT`` to ``VoucherCollection`` is larger than
+        ``MAX_VOUCHER_BODY`` then the response is *BAD REQUEST* even if the
+        body is otherwise valid.
+        """
+        self.fixed.set_api_auth_token(api_auth_token)
+        body = voucher_body(voucher)
+        body += b" " * (MAX_VOUCHER_BODY + 1 - len(body))
+        self.assertThat(
+            render_sync(
+                api_auth_token,
+                self.fixed.root,
+                b"PUT",
+                b"/voucher",
+                body=body,
             ),
+            bad_request_response(),
         )
 
-    @given(tahoe_configs(), api_auth_tokens(), not_vouchers())
+    @given(any_api_auth_tokens, not_vouchers())
     def test_get_invalid_voucher(
-        self, get_config: GetConfig, api_auth_token: bytes, not_voucher: bytes
+        self, api_auth_token: bytes, not_voucher: bytes
     ) -> None:
         """
         When a syntactically invalid voucher is requested with a ``GET`` to a
         child of ``VoucherCollection`` the response is **BAD REQUEST**.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
-        url = "http://127.0.0.1/voucher/{}".format(
+        self.fixed.set_api_auth_token(api_auth_token)
+        path = "/voucher/{}".format(
             quote(
                 not_voucher,
                 safe=b"",
             ),
         ).encode("ascii")
-        requesting = authorized_request(
-            api_auth_token,
-            agent,
-            b"GET",
-            url,
-        )
         self.assertThat(
-            requesting,
-            succeeded(
-                bad_request_response(),
+            render_sync(
+                api_auth_token,
+                self.fixed.root,
+                b"GET",
+                path,
             ),
+            bad_request_response(),
         )
 
-    @given(tahoe_configs(), api_auth_tokens(), vouchers())
-    def test_get_unknown_voucher(
-        self, get_config: GetConfig, api_auth_token: bytes, voucher: bytes
+    @given(
+        any_api_auth_tokens,
+        # A leading 0xff byte makes sure the segment is not valid UTF-8.
+        binary().map(lambda b: b"\xff" + b),
+    )
+    def test_get_undecodeable_voucher(
+        self, api_auth_token: bytes, not_voucher: bytes
     ) -> None:
+        """
+        When a child of ``VoucherCollection`` which is not even valid UTF-8 is
+        requested with a ``GET`` the response is **BAD REQUEST**.
+        """
+        self.fixed.set_api_auth_token(api_auth_token)
+        path = "/voucher/{}".format(
+            quote(
+                not_voucher,
+                safe=b"",
+            ),
+        ).encode("ascii")
+        self.assertThat(
+            render_sync(
+                api_auth_token,
+                self.fixed.root,
+                b"GET",
+                path,
+            ),
+            bad_request_response(),
+        )
+
+    @given(any_api_auth_tokens, any_vouchers)
+    def test_get_unknown_voucher(self, api_auth_token: bytes, voucher: bytes) -> None:
         """
         When a voucher is requested with a ``GET`` to a child of
         ``VoucherCollection`` the response is **NOT FOUND** if the voucher
         hasn't previously been submitted with a ``PUT``.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
-        requesting = authorized_request(
-            api_auth_token,
-            agent,
-            b"GET",
-            b"http://127.0.0.1/voucher/" + voucher,
-        )
+        self.fixed.set_api_auth_token(api_auth_token)
         self.assertThat(
-            requesting,
-            succeeded(
-                not_found_response(),
+            render_sync(
+                api_auth_token,
+                self.fixed.root,
+                b"GET",
+                b"/voucher/" + voucher,
             ),
+            not_found_response(),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(client_nonredeemer_configurations()),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        vouchers(),
+        any_vouchers,
     )
     def test_get_known_voucher_redeeming(
         self, config: Config, api_auth_token: bytes, now: datetime, voucher: bytes
@@ -1376,24 +1718,23 @@ class VoucherTests(TestCase):
             api_auth_token,
             now,
             voucher,
-            MatchesStructure(
-                number=Equals(voucher),
-                expected_tokens=Equals(count),
-                created=Equals(now),
-                state=Equals(
-                    Redeeming(
-                        started=now,
-                        counter=0,
-                    )
+            Voucher(
+                number=voucher,
+                expected_tokens=count,
+                created=now,
+                state=Redeeming(
+                    started=now,
+                    counter=0,
                 ),
             ),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(client_dummyredeemer_configurations()),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        vouchers(),
+        any_vouchers,
     )
     def test_get_known_voucher_redeemed(
         self, config: Config, api_auth_token: bytes, now: datetime, voucher: bytes
@@ -1410,24 +1751,23 @@ class VoucherTests(TestCase):
             api_auth_token,
             now,
             voucher,
-            MatchesStructure(
-                number=Equals(voucher),
-                expected_tokens=Equals(count),
-                created=Equals(now),
-                state=Equals(
-                    Redeemed(
-                        finished=now,
-                        token_count=count,
-                    )
+            Voucher(
+                number=voucher,
+                expected_tokens=count,
+                created=now,
+                state=Redeemed(
+                    finished=now,
+                    token_count=count,
                 ),
             ),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(client_doublespendredeemer_configurations()),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        vouchers(),
+        any_vouchers,
     )
     def test_get_known_voucher_doublespend(
         self, config: Config, api_auth_token: bytes, now: datetime, voucher: bytes
@@ -1445,23 +1785,22 @@ class VoucherTests(TestCase):
             api_auth_token,
             now,
             voucher,
-            MatchesStructure(
-                number=Equals(voucher),
-                expected_tokens=Equals(count),
-                created=Equals(now),
-                state=Equals(
-                    DoubleSpend(
-                        finished=now,
-                    )
+            Voucher(
+                number=voucher,
+                expected_tokens=count,
+                created=now,
+                state=DoubleSpend(
+                    finished=now,
                 ),
             ),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(client_unpaidredeemer_configurations()),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        vouchers(),
+        any_vouchers,
     )
     def test_get_known_voucher_unpaid(
         self, config: Config, api_auth_token: bytes, now: datetime, voucher: bytes
@@ -1479,23 +1818,22 @@ class VoucherTests(TestCase):
             api_auth_token,
             now,
             voucher,
-            MatchesStructure(
-                number=Equals(voucher),
-                expected_tokens=Equals(count),
-                created=Equals(now),
-                state=Equals(
-                    Unpaid(
-                        finished=now,
-                    )
+            Voucher(
+                number=voucher,
+                expected_tokens=count,
+                created=now,
+                state=Unpaid(
+                    finished=now,
                 ),
             ),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(client_errorredeemer_configurations(TRANSIENT_ERROR)),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        vouchers(),
+        any_vouchers,
     )
     def test_get_known_voucher_error(
         self, config: Config, api_auth_token: bytes, now: datetime, voucher: bytes
@@ -1513,15 +1851,13 @@ class VoucherTests(TestCase):
             api_auth_token,
             now,
             voucher,
-            MatchesStructure(
-                number=Equals(voucher),
-                expected_tokens=Equals(count),
-                created=Equals(now),
-                state=Equals(
-                    Error(
-                        finished=now,
-                        details=TRANSIENT_ERROR,
-                    )
+            Voucher(
+                number=voucher,
+                expected_tokens=count,
+                created=now,
+                state=Error(
+                    finished=now,
+                    details=TRANSIENT_ERROR,
                 ),
             ),
         )
@@ -1532,14 +1868,13 @@ class VoucherTests(TestCase):
         api_auth_token: bytes,
         now: datetime,
         voucher: bytes,
-        voucher_matcher: Matcher[bytes],
+        expected: Voucher,
     ) -> None:
         """
-        Assert that a voucher that is ``PUT`` and then ``GET`` is represented in
-        the JSON response.
+        Assert that a voucher that is submitted for redemption and then ``GET``
+        is represented in the JSON response.
 
-        :param voucher_matcher: A matcher which matches the voucher expected
-            to be returned by the ``GET``.
+        :param expected: The voucher expected to be returned by the ``GET``.
         """
         add_api_token_to_config(
             self.useFixture(TempDir()).join("tahoe"),
@@ -1548,30 +1883,17 @@ class VoucherTests(TestCase):
         )
         root = root_from_config(config, lambda: now)
         agent = RequestTraversalAgent(root)
-        putting = authorized_request(
-            api_auth_token,
-            agent,
-            b"PUT",
-            b"http://127.0.0.1/voucher",
-            data=BytesIO(dumps_utf8({"voucher": voucher.decode("ascii")})),
-        )
-        self.assertThat(
-            putting,
-            succeeded(
-                ok_response(),
-            ),
-        )
+        # Start redemption the same way a PUT does.  PUT handling itself is
+        # covered by test_put_voucher.
+        Deferred.fromCoroutine(root.controller.redeem(voucher))
 
         getting = authorized_request(
             api_auth_token,
             agent,
             b"GET",
-            "http://127.0.0.1/voucher/{}".format(
-                quote(
-                    voucher,
-                    safe="",
-                ),
-            ).encode("ascii"),
+            # Vouchers are urlsafe-base64 so they need no quoting to be used
+            # as a path segment.
+            b"http://127.0.0.1/voucher/" + voucher,
         )
         self.assertThat(
             getting,
@@ -1583,7 +1905,7 @@ class VoucherTests(TestCase):
                         succeeded(
                             AfterPreprocessing(
                                 Voucher.from_json,
-                                voucher_matcher,
+                                Equals(expected),
                             ),
                         ),
                     ),
@@ -1591,11 +1913,12 @@ class VoucherTests(TestCase):
             ),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        lists(vouchers(), unique=True),
+        lists(any_vouchers, unique=True),
     )
     def test_list_vouchers(
         self,
@@ -1632,11 +1955,12 @@ class VoucherTests(TestCase):
             ),
         )
 
+    @io_heavy
     @given(
         direct_tahoe_configs(client_unpaidredeemer_configurations()),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         aware_datetimes(),
-        lists(vouchers(), unique=True),
+        lists(any_vouchers, unique=True),
     )
     def test_list_vouchers_transient_states(
         self,
@@ -1694,21 +2018,26 @@ class VoucherTests(TestCase):
 
         note("{} vouchers".format(len(vouchers)))
 
-        for voucher in vouchers:
-            data = BytesIO(dumps_utf8({"voucher": voucher.decode("ascii")}))
-            putting = authorized_request(
-                api_auth_token,
-                agent,
-                b"PUT",
-                b"http://127.0.0.1/voucher",
-                data=data,
-            )
-            self.assertThat(
-                putting,
-                succeeded(
-                    ok_response(),
-                ),
-            )
+        # Issue all of the PUTs before looking at any of the responses so the
+        # agent can service them together.
+        putting = gatherResults(
+            [
+                authorized_request(
+                    api_auth_token,
+                    agent,
+                    b"PUT",
+                    b"http://127.0.0.1/voucher",
+                    data=BytesIO(voucher_body(voucher)),
+                )
+                for voucher in vouchers
+            ]
+        )
+        self.assertThat(
+            putting,
+            succeeded(
+                AllMatch(ok_response()),
+            ),
+        )
 
         getting = authorized_request(
             api_auth_token,
@@ -1835,38 +2164,14 @@ def bad_calculate_price_requests() -> SearchStrategy[Request]:
 
     bad_data_junk = binary()
 
-    good_fields = {
-        "method": good_methods,
-        "headers": good_headers,
-        "data": good_data,
-    }
-
-    bad_choices = {
-        "method": bad_methods,
-        "headers": bad_headers,
-        "data": one_of(bad_data_version, bad_data_sizes, bad_data_other, bad_data_junk),
-    }
-
-    def pick_field(
-        candidate_name: str,
-        match_name: str,
-        if_match: dict[str, T],
-        if_mismatch: dict[str, T],
-    ) -> T:
-        return (if_match if candidate_name == match_name else if_mismatch)[
-            candidate_name
-        ]
-
-    bad_field_name = sampled_from(list(bad_choices.keys()))
-
-    def build_request(bad_field_name: str) -> SearchStrategy[Request]:
-        method = pick_field("method", bad_field_name, good_fields, bad_choices)
-        headers = pick_field("headers", bad_field_name, good_fields, bad_choices)
-        data = pick_field("data", bad_field_name, good_fields, bad_choices)
-
-        return builds(Request, method, headers, data)
+    bad_data = one_of(bad_data_version, bad_data_sizes, bad_data_other, bad_data_junk)
 
-    return bad_field_name.flatmap(build_request)
+    # Exactly one field of each request is bad.
+    return one_of(
+        builds(Request, bad_methods, good_headers, good_data),
+        builds(Request, good_methods, bad_headers, good_data),
+        builds(Request, good_methods, good_headers, bad_data),
+    )
 
 
 class CalculatePriceTests(TestCase):
@@ -1875,16 +2180,30 @@ class CalculatePriceTests(TestCase):
     ``_zkapauthorizer.resource`` module.
     """
 
+    def setUp(self) -> None:
+        super(CalculatePriceTests, self).setUp()
+        # Shared by all Hypothesis examples.  See FromConfigurationTests.setUp.
+        self.tempdir = self.useFixture(TempDir())
+        self._fixed: Optional[FixedRoot] = None
+
+    @property
+    def fixed(self) -> FixedRoot:
+        """
+        A root resource shared by all the examples of a test.  See
+        ResourceTests.setUp.  ``test_calculated_price`` needs a differently
+        configured root so this is only built for the tests which use it.
+        """
+        if self._fixed is None:
+            self._fixed = FixedRoot.create(self.tempdir.join("fixed"))
+        return self._fixed
+
     url = b"http://127.0.0.1/calculate-price"
 
     @given(
-        tahoe_configs(),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         bad_calculate_price_requests(),
     )
-    def test_bad_request(
-        self, get_config: GetConfig, api_auth_token: bytes, bad_request: Request
-    ) -> None:
+    def test_bad_request(self, api_auth_token: bytes, bad_request: Request) -> None:
         """
         When approached with:
 
@@ -1898,34 +2217,26 @@ class CalculatePriceTests(TestCase):
 
         response code is not in the 200 range.
         """
-        config = get_config_with_api_token(
-            self.useFixture(TempDir()),
-            get_config,
-            api_auth_token,
-        )
-        root = root_from_config(config, aware_now)
-        agent = RequestTraversalAgent(root)
+        self.fixed.set_api_auth_token(api_auth_token)
         self.assertThat(
-            authorized_request(
+            render_sync(
                 api_auth_token,
-                agent,
+                self.fixed.root,
                 bad_request.method,
-                self.url,
+                b"/calculate-price",
                 headers=bad_request.headers,
-                data=BytesIO(bad_request.data),
+                body=bad_request.data,
             ),
-            succeeded(
-                matches_response(
-                    code_matcher=MatchesAny(
-                        # It is fine to signal client errors
-                        between(400, 499),
-                        # It is fine to say we didn't implement the request
-                        # method (I guess - Twisted Web sort of forces it on
-                        # us, I'd rather have NOT ALLOWED for this case
-                        # instead...).  We don't want INTERNAL SERVER ERROR
-                        # though.
-                        Equals(NOT_IMPLEMENTED),
-                    ),
+            MatchesStructure(
+                code=MatchesAny(
+                    # It is fine to signal client errors
+                    between(400, 499),
+                    # It is fine to say we didn't implement the request
+                    # method (I guess - Twisted Web sort of forces it on
+                    # us, I'd rather have NOT ALLOWED for this case
+                    # instead...).  We don't want INTERNAL SERVER ERROR
+                    # though.
+                    Equals(NOT_IMPLEMENTED),
                 ),
             ),
         )
@@ -1948,7 +2259,7 @@ class CalculatePriceTests(TestCase):
                 ),
             ),
         ),
-        api_auth_tokens(),
+        any_api_auth_tokens,
         lists(integers(min_value=0)),
     )
     def test_calculated_price(
@@ -1970,7 +2281,7 @@ class CalculatePriceTests(TestCase):
         (encoding_params, min_time_remaining), config = encoding_params_and_config
         shares_needed, shares_happy, shares_total = encoding_params
         add_api_token_to_config(
-            self.useFixture(TempDir()).join("tahoe"),
+            self.tempdir.join("tahoe"),
             config,
             api_auth_token,
         )
@@ -2009,11 +2320,12 @@ class CalculatePriceTests(TestCase):
         )
 
 
+# These matcher factories are called for many assertions with the same (or
+# no) arguments.  The matchers they build can be shared, so build each just
+# once.
+@lru_cache(maxsize=None)
 def application_json() -> Matcher[Headers]:
-    return AfterPreprocessing(  # type: ignore[no-any-return]
-        lambda h: h.getRawHeaders("content-type"),
-        Equals(["application/json"]),
-    )
+    return _ApplicationJSON()
 
 
 def json_content(response: IResponse) -> Deferred[JSON]:
@@ -2022,16 +2334,19 @@ def json_content(response: IResponse) -> Deferred[JSON]:
     return loading
 
 
+@lru_cache(maxsize=None)
 def ok_response(headers: Optional[Matcher[Headers]] = None) -> Matcher[IResponse]:
     return match_response(OK, headers, phrase=Equals(b"OK"))
 
 
+@lru_cache(maxsize=None)
 def not_found_response(
     headers: Optional[Matcher[Headers]] = None,
 ) -> Matcher[IResponse]:
     return match_response(NOT_FOUND, headers)
 
 
+@lru_cache(maxsize=None)
 def bad_request_response(
     headers: Optional[Matcher[Headers]] = None,
 ) -> Matcher[IResponse]:
@@ -2039,7 +2354,7 @@ def bad_request_response(
 
 
 def match_response(
-    code: int, headers: Optional[Matcher[Headers]], phrase: Matcher[str] = Always()
+    code: int, headers: Optional[Matcher[Headers]], phrase: Matcher[bytes] = Always()
 ) -> Matcher[IResponse]:
     if headers is None:
         headers = Always()
@@ -2050,25 +2365,72 @@ def match_response(
     )
 
 
+# testtools only exposes ``Always`` as a function returning an instance.
+_AlwaysType = type(Always())
+
+
 @frozen
 class _MatchResponse(Matcher[IResponse]):
-    code: int
-    headers: Headers
-    phrase: str
-    _details: dict[str, object] = Factory(dict)
+    code: Matcher[int]
+    headers: Matcher[Headers]
+    phrase: Matcher[bytes]
+
+    # The (attribute name, matcher) pairs that can actually fail.  Matching
+    # skips fields whose matcher is ``Always()``.
+    _checks: tuple[tuple[str, Matcher[Any]], ...] = field(init=False)
+
+    @_checks.default
+    def _get_checks(self) -> tuple[tuple[str, Matcher[Any]], ...]:
+        candidates: list[tuple[str, Matcher[Any]]] = [
+            ("code", self.code),
+            ("headers", self.headers),
+            ("phrase", self.phrase),
+        ]
+        return tuple(
+            (name, matcher)
+            for (name, matcher) in candidates
+            if not isinstance(matcher, _AlwaysType)
+        )
 
     def match(self, response: IResponse) -> Optional[Mismatch]:
-        self._details.update(
+        # Compare the fields directly rather than building a MatchesStructure
+        # for every match.  The description has the same form as
+        # MatchesStructure's.
+        differences = []
+        for name, matcher in self._checks:
+            mismatch = matcher.match(getattr(response, name))
+            if mismatch is not None:
+                differences.append(f"{mismatch.describe()}: {name}")
+        if not differences:
+            return None
+        # Describe the whole response alongside the failure.  This is only
+        # done for mismatches so matching keeps no per-response state and
+        # instances can be shared.
+        return Mismatch(
+            "\n".join(["Differences: [", *differences, "]"]),
             {
-                "code": response.code,
-                "headers": response.headers.getAllRawHeaders(),
-            }
+                "code": text_content(str(response.code)),
+                "headers": text_content(
+                    repr(list(response.headers.getAllRawHeaders()))
+                ),
+            },
         )
-        return MatchesStructure(
-            code=self.code,
-            headers=self.headers,
-            phrase=self.phrase,
-        ).match(response)
 
-    def get_details(self) -> dict[str, object]:
-        return self._details
+
+@frozen
+class _ApplicationJSON(Matcher[Headers]):
+    """
+    Match headers with a content-type of exactly **application/json**.
+    """
+
+    def match(self, headers: Headers) -> Optional[Mismatch]:
+        content_type = headers.getRawHeaders("content-type")
+        # Check the usual single-value case without building a list to
+        # compare against.
+        if (
+            content_type is not None
+            and len(content_type) == 1
+            and content_type[0] == "application/json"
+        ):
+            return None
+        return Mismatch(f"{content_type!r} != ['application/json']: content-type")
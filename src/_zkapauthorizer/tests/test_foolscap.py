@@ -18,17 +18,19 @@ Tests for Foolscap-related test helpers.
 
 from typing import Optional, cast
 
+from allmydata.interfaces import MAX_BUCKETS
 from fixtures import Fixture
 from foolscap.api import Any, RemoteInterface, Violation  # type: ignore[attr-defined]
 from foolscap.furl import decode_furl
 from foolscap.pb import Tub
 from foolscap.referenceable import (
+    Referenceable,
     RemoteReference,
     RemoteReferenceOnly,
     RemoteReferenceTracker,
 )
 from hypothesis import given
-from hypothesis.strategies import just, one_of
+from hypothesis.strategies import binary, builds, dictionaries, integers, just, one_of
 from testtools import TestCase
 from testtools.matchers import (
     AfterPreprocessing,
@@ -39,9 +41,18 @@ from testtools.matchers import (
 )
 from testtools.twistedsupport import failed, succeeded
 from twisted.internet.defer import Deferred
+from twisted.python.failure import Failure
 from twisted.trial.unittest import TestCase as TrialTestCase
+from zope.interface import implementer
 
-from ..foolscap import ShareStat
+from ..foolscap import (
+    _PACKED_SHARE_STAT,
+    RIPrivacyPassAuthorizedStorageServer,
+    ShareStat,
+    ShareStatConstraint,
+    pack_share_stats,
+    unpack_share_stats,
+)
 from .common import async_test
 from .foolscap import BrokenCopyable, DummyReferenceable, Echoer, LocalRemote, RIStub
 
@@ -173,17 +184,139 @@ class LocalRemoteTests(TestCase):
         )
 
 
+class ShareStatConstraintTests(TestCase):
+    """
+    Tests for ``ShareStatConstraint``.
+    """
+
+    @given(
+        integers(min_value=0, max_value=2**63),
+        integers(min_value=0, max_value=2**63),
+    )
+    def test_accepts_sharestat(self, size: int, lease_expiration: int) -> None:
+        """
+        ``ShareStatConstraint.checkObject`` accepts a ``ShareStat`` with integer
+        attributes.
+        """
+        ShareStatConstraint().checkObject(ShareStat(size, lease_expiration), True)
+
+    def test_rejects_other_types(self) -> None:
+        """
+        ``ShareStatConstraint.checkObject`` raises ``Violation`` for an object
+        which is not a ``ShareStat``.
+        """
+        self.assertRaises(
+            Violation,
+            lambda: ShareStatConstraint().checkObject({"size": 1}, True),
+        )
+
+    def test_rejects_non_integer_attributes(self) -> None:
+        """
+        ``ShareStatConstraint.checkObject`` raises ``Violation`` for a
+        ``ShareStat`` with an attribute which is not an integer.
+        """
+        self.assertRaises(
+            Violation,
+            lambda: ShareStatConstraint().checkObject(
+                ShareStat(size="big"),  # type: ignore[arg-type]
+                True,
+            ),
+        )
+
+
+class PackedShareStatsTests(TestCase):
+    """
+    Tests for ``pack_share_stats`` and ``unpack_share_stats``.
+    """
+
+    @given(
+        dictionaries(
+            integers(min_value=0, max_value=255),
+            builds(
+                ShareStat,
+                size=integers(min_value=0, max_value=2**64 - 1),
+                lease_expiration=integers(min_value=0, max_value=2**64 - 1),
+            ),
+        )
+    )
+    def test_roundtrip(self, stats: dict[int, ShareStat]) -> None:
+        """
+        Share stats round-trip through ``pack_share_stats`` and
+        ``unpack_share_stats``.
+        """
+        self.assertThat(
+            unpack_share_stats(pack_share_stats(stats.items())),
+            Equals(stats),
+        )
+
+    @given(
+        # Extend any multiple of the packed size by a byte instead of
+        # filtering, so Hypothesis never has to discard an example.
+        binary().map(lambda b: b if len(b) % _PACKED_SHARE_STAT.size else b + b"x")
+    )
+    def test_wrong_length(self, packed: bytes) -> None:
+        """
+        ``unpack_share_stats`` raises ``ValueError`` if given a byte string with
+        a length which is not a multiple of the packed share stat size.
+        """
+        self.assertRaises(ValueError, lambda: unpack_share_stats(packed))
+
+
+class RIShareStats(RemoteInterface):
+    """
+    The share stat methods of ``RIPrivacyPassAuthorizedStorageServer``, with
+    their real schemas, and nothing else.
+    """
+
+    __remote_name__ = "RIShareStats.tests.zkapauthorizer.privatestorage.io"
+
+    stat_shares = RIPrivacyPassAuthorizedStorageServer["stat_shares"]  # type: ignore[type-arg]
+    stat_shares_packed = RIPrivacyPassAuthorizedStorageServer["stat_shares_packed"]  # type: ignore[type-arg]
+
+
+@implementer(
+    RIShareStats  # type: ignore # zope.interface.implementer accepts interface, not ...
+)
+class CannedShareStats(Referenceable):
+    """
+    Respond to every share stat call with the same canned result.
+    """
+
+    def __init__(self, stats: list[dict[int, ShareStat]]) -> None:
+        self.stats = stats
+
+    def remote_stat_shares(
+        self, storage_indexes_or_slots: list[bytes]
+    ) -> list[dict[int, ShareStat]]:
+        return self.stats
+
+    def remote_stat_shares_packed(
+        self, storage_indexes_or_slots: list[bytes]
+    ) -> list[bytes]:
+        return [pack_share_stats(stats.items()) for stats in self.stats]
+
+
 class EchoerFixture(Fixture):
+    """
+    Serve a ``Referenceable`` from a real ``Tub`` listening on a TCP port.
+
+    :ivar furl: The fURL of the ``Referenceable``.
+    """
+
     tub: Tub
     furl: bytes
 
-    def __init__(self) -> None:
+    def __init__(self, referenceable: Optional[Referenceable] = None) -> None:
+        """
+        :param referenceable: The object to serve.  By default, an ``Echoer``.
+        """
         self.tub = Tub()
         self.tub.setLocation(b"tcp:0")
+        self.referenceable = Echoer() if referenceable is None else referenceable
 
     def _setUp(self) -> None:
         self.tub.startService()
-        self.furl = self.tub.registerReference(Echoer())
+        self.furl = self.tub.registerReference(self.referenceable)
 
     def _cleanUp(self) -> Optional[Deferred[object]]:
         return cast(Optional[Deferred[object]], self.tub.stopService())
@@ -202,16 +335,71 @@ class SerializationTests(TrialTestCase):
         """
         await self._roundtrip_test(ShareStat(1, 2))
 
+    @async_test
+    async def test_stat_shares(self) -> None:
+        """
+        A ``stat_shares`` result, constrained by ``ShareStatConstraint``, can be
+        received from a Foolscap remote method call.
+        """
+        stats = [{}, {0: ShareStat(1, 2), 3: ShareStat(2**63, 0)}]
+        remote = await self._get_remote(CannedShareStats(stats))
+        received = await remote.callRemote("stat_shares", [b"x" * 16, b"y" * 16])
+        self.assertEqual(stats, received)
+
+    @async_test
+    async def test_stat_shares_packed(self) -> None:
+        """
+        A ``stat_shares_packed`` result, constrained by a
+        ``ByteStringConstraint``, can be received from a Foolscap remote method
+        call, even when it holds stats for as many shares as one storage index
+        can have.
+        """
+        stats = [
+            {},
+            {
+                sharenum: ShareStat(sharenum, 2**64 - 1)
+                for sharenum in range(MAX_BUCKETS)
+            },
+        ]
+        remote = await self._get_remote(CannedShareStats(stats))
+        received = await remote.callRemote("stat_shares_packed", [b"x" * 16, b"y" * 16])
+        self.assertEqual(stats, [unpack_share_stats(packed) for packed in received])
+
+    @async_test
+    async def test_stat_shares_packed_too_large(self) -> None:
+        """
+        A ``stat_shares_packed`` result holding stats for more shares than one
+        storage index can have is rejected.
+        """
+        stats = [{sharenum: ShareStat(0, 0) for sharenum in range(MAX_BUCKETS + 1)}]
+        remote = await self._get_remote(CannedShareStats(stats))
+        # The server's own check of its result fails first so what arrives
+        # is a copy of the Violation, which cannot be raised as it is.
+        failures: list[Failure] = []
+        await remote.callRemote("stat_shares_packed", [b"x" * 16]).addCallbacks(
+            self.fail, failures.append
+        )
+        self.assertTrue(failures[0].check(Violation))
+
     async def _roundtrip_test(self, obj: object) -> None:
         """
         Send ``obj`` over Foolscap and receive it back again, equal to itself.
         """
+        echoer = await self._get_remote(None)
+        received = await echoer.callRemote("echo", obj)
+        self.assertEqual(obj, received)
+
+    async def _get_remote(
+        self, referenceable: Optional[Referenceable]
+    ) -> RemoteReference:
+        """
+        Serve ``referenceable`` from a real ``Tub`` and get a remote reference
+        to it.  See ``EchoerFixture``.
+        """
         # So sad.  No Deferred support in testtools.TestCase or
         # fixture.Fixture, no fixture support in
         # twisted.trial.unittest.TestCase.
-        fx = EchoerFixture()
+        fx = EchoerFixture(referenceable)
         fx.setUp()
         self.addCleanup(fx._cleanUp)
-        echoer = await fx.tub.getReference(fx.furl)
-        received = await echoer.callRemote("echo", obj)
-        self.assertEqual(obj, received)
+        return cast(RemoteReference, await fx.tub.getReference(fx.furl))
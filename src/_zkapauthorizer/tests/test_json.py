@@ -0,0 +1,122 @@
+# Copyright 2022 PrivateStorage.io, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for ``_zkapauthorizer._json``.
+"""
+
+from hypothesis import given
+from hypothesis.strategies import (
+    booleans,
+    characters,
+    dictionaries,
+    floats,
+    integers,
+    lists,
+    none,
+    recursive,
+    text,
+)
+from testtools import TestCase
+from testtools.matchers import Equals, Not
+
+from .._json import dumps_utf8, loads
+
+# JSON-compatible values.  NaN and the infinities are left out because they
+# are not valid JSON.
+json_values = recursive(
+    none()
+    | booleans()
+    | integers()
+    | floats(allow_nan=False, allow_infinity=False)
+    | text(),
+    lambda children: lists(children) | dictionaries(text(), children),
+)
+
+
+class JSONTests(TestCase):
+    """
+    Tests for ``dumps_utf8`` and ``loads``.
+    """
+
+    @given(json_values)
+    def test_roundtrip(self, value: object) -> None:
+        """
+        Values round-trip through ``dumps_utf8`` and ``loads``.
+        """
+        self.assertThat(
+            loads(dumps_utf8(value)),
+            Equals(value),
+        )
+
+    @given(integers(min_value=2**64))
+    def test_large_integers(self, value: int) -> None:
+        """
+        Integers too large for 64 bits are loaded as exact integers.
+        """
+        self.assertThat(
+            loads(b"[%d, -%d]" % (value, value)),
+            Equals([value, -value]),
+        )
+
+    @given(integers(min_value=2**64))
+    def test_large_integers_text(self, value: int) -> None:
+        """
+        Integers too large for 64 bits are loaded as exact integers from text
+        as well as from bytes.
+        """
+        self.assertThat(
+            loads("[%d]" % (value,)),
+            Equals([value]),
+        )
+
+    @given(integers(min_value=-(10**19 - 1), max_value=-(2**63) - 1))
+    def test_short_negative_integers(self, value: int) -> None:
+        """
+        Negative integers too large for 64 bits but with only 19 digits are
+        loaded as exact integers.
+        """
+        self.assertThat(
+            loads(dumps_utf8([value])),
+            Equals([value]),
+        )
+
+    def test_non_finite_floats(self) -> None:
+        """
+        NaN and the infinities are written the way the stdlib encoder writes
+        them, not as ``null``, and are loaded back.
+        """
+        value = [float("inf"), float("-inf"), None]
+        self.assertThat(
+            dumps_utf8(value),
+            Equals(b"[Infinity, -Infinity, null]"),
+        )
+        self.assertThat(
+            loads(dumps_utf8(value)),
+            Equals(value),
+        )
+        [nan] = loads(dumps_utf8([float("nan")]))  # type: ignore[misc]
+        self.assertThat(nan, Not(Equals(nan)))
+
+    @given(characters(min_codepoint=0xD800, max_codepoint=0xDFFF))
+    def test_lone_surrogates(self, surrogate: str) -> None:
+        """
+        Strings containing lone surrogates round-trip through ``dumps_utf8``
+        and ``loads``.
+        """
+        value = {"a": "x" + surrogate}
+        self.assertThat(
+            loads(dumps_utf8(value)),
+            Equals(value),
+        )
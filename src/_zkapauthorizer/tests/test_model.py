@@ -389,6 +389,39 @@ class VoucherStoreTests(TestCase):
             raises(KeyError),
         )
 
+    @given(tahoe_configs(), aware_datetimes(), vouchers())
+    def test_find_missing(
+        self, get_config: GetConfig, now: datetime, voucher: bytes
+    ) -> None:
+        """
+        ``VoucherStore.find`` returns ``None`` when called with a voucher not
+        previously added to the store.
+        """
+        store = self.useFixture(TemporaryVoucherStore(lambda: now, get_config)).store
+        self.assertThat(store.find(voucher), Is(None))
+
+    @given(
+        tahoe_configs(),
+        vouchers(),
+        lists(random_tokens(), min_size=1, unique=True),
+        aware_datetimes(),
+    )
+    def test_find(
+        self,
+        get_config: GetConfig,
+        voucher: bytes,
+        tokens: list[RandomToken],
+        now: datetime,
+    ) -> None:
+        """
+        ``VoucherStore.find`` returns the same ``Voucher`` as
+        ``VoucherStore.get`` for a voucher previously added to the store with
+        ``VoucherStore.add``.
+        """
+        store = self.useFixture(TemporaryVoucherStore(lambda: now, get_config)).store
+        store.add(voucher, len(tokens), 0, lambda: tokens)
+        self.assertThat(store.find(voucher), Equals(store.get(voucher)))
+
     @given(
         tahoe_configs(),
         vouchers(),
@@ -624,6 +624,10 @@ class ShareTests(TestCase):
             from_awaitable(self.client.stat_shares([storage_index])),
             succeeded(Equals(expected)),
         )
+        self.assertThat(
+            from_awaitable(self.client.stat_shares_packed([storage_index])),
+            succeeded(Equals(expected)),
+        )
 
     @given(
         storage_index=storage_indexes(),
@@ -900,6 +904,10 @@ class ShareTests(TestCase):
             from_awaitable(self.client.stat_shares([storage_index])),
             succeeded(Equals(expected)),
         )
+        self.assertThat(
+            from_awaitable(self.client.stat_shares_packed([storage_index])),
+            succeeded(Equals(expected)),
+        )
 
     @skipIf(
         platform.isWindows(),